@@ -1,4 +1,5 @@
 from .currency_wallet import CurrencyWallet
 from .account import Account
+from .balance_book import BalanceBook
 from .find_account import FindAccount
-from .financial_engine import FinancialEngine
+from .financial_engine import FinancialEngine, Txn
@@ -3,26 +3,45 @@ Account – user registry, inherits from CurrencyWallet.
 """
 from .currency_wallet import CurrencyWallet
 
+# Characters people type between digit groups, e.g. "071-234 5678"
+_PHONE_SEPARATORS = str.maketrans("", "", " -.()")
+
 class Account(CurrencyWallet):
     """
-    Maintains a mapping from phone number to user name.
+    Maintains a mapping from phone number to user name. Phone numbers are
+    keyed as integers, so "0712345678" and "712345678" name the same user.
     """
     def __init__(self):
         super().__init__()
-        self.contacts = {}  # phone -> name
+        self.contacts = {}  # phone (int) -> name
+
+    @staticmethod
+    def _phone_key(phone: str | int) -> int:
+        """Normalize a phone number to the int64 used as registry key."""
+        # Accept E.164 form and grouped digits: "+254 712-345678" keys as 254712345678
+        digits = str(phone).strip().removeprefix("+").translate(_PHONE_SEPARATORS)
+        # E.164 caps numbers at 15 digits, which always fits in an int64
+        if not digits.isdecimal() or len(digits.lstrip("0")) > 15:
+            raise ValueError(f"Invalid phone number: {phone}")
+        return int(digits)
 
     def register(self, phone: str, name: str) -> None:
         """Register a new user with given phone and name."""
-        if phone in self.contacts:
+        key = self._phone_key(phone)
+        if key in self.contacts:
             raise ValueError(f"User with phone {phone} already exists.")
-        self.contacts[phone] = name
+        self.contacts[key] = name
 
     def exists(self, phone: str) -> bool:
         """Check if a user with the given phone exists."""
-        return phone in self.contacts
+        try:
+            return self._phone_key(phone) in self.contacts
+        except ValueError:
+            return False  # not a phone number, so not a registered user
 
     def get_name(self, phone: str) -> str:
         """Return the name associated with a phone number."""
-        if not self.exists(phone):
+        key = self._phone_key(phone)
+        if key not in self.contacts:
             raise ValueError(f"User {phone} not found.")
-        return self.contacts[phone]
+        return self.contacts[key]
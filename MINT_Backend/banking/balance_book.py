@@ -0,0 +1,73 @@
+"""
+BalanceBook – phone -> balance mapping packed into a contiguous int64 array.
+"""
+from array import array
+from collections.abc import MutableMapping
+
+try:
+    import numpy as np
+except ImportError:  # optional; scaled() falls back to a Python loop
+    np = None
+
+class BalanceBook(MutableMapping):
+    """
+    Maps int64 phone -> integer balance (base currency micro-units). Phones
+    and balances live in parallel int64 arrays indexed through a
+    phone -> position dict, so every balance can be scaled in a single
+    vectorized operation. Unknown phones read as 0 without being inserted.
+    """
+    def __init__(self, initial=None):
+        self._index = {}  # phone -> position in _values
+        self._phones = array('q')  # position -> phone
+        self._values = array('q')
+        if initial:
+            self.update(initial)
+
+    def __getitem__(self, phone) -> int:
+        i = self._index.get(phone)
+        return 0 if i is None else self._values[i]
+
+    def __setitem__(self, phone, value: int) -> None:
+        i = self._index.get(phone)
+        if i is None:
+            # Append to both arrays before publishing the index so a value
+            # outside int64 (OverflowError) leaves the book unchanged
+            self._values.append(value)
+            try:
+                self._phones.append(phone)
+            except OverflowError:
+                self._values.pop()
+                raise
+            self._index[phone] = len(self._phones) - 1
+        else:
+            self._values[i] = value
+
+    def __delitem__(self, phone) -> None:
+        """Remove a phone by moving the last entry into its slot."""
+        i = self._index.pop(phone)
+        last, value = self._phones.pop(), self._values.pop()
+        if i < len(self._phones):
+            self._phones[i] = last
+            self._values[i] = value
+            self._index[last] = i
+
+    def __contains__(self, phone) -> bool:
+        return phone in self._index
+
+    def __iter__(self):
+        return iter(self._phones)
+
+    def __len__(self) -> int:
+        return len(self._phones)
+
+    def __repr__(self) -> str:
+        return f"BalanceBook({dict(self.items())!r})"
+
+    def scaled(self, factor: float):
+        """
+        Return every balance multiplied by factor, in iteration order: a new
+        float64 ndarray when NumPy is installed, otherwise a list.
+        """
+        if np is None:
+            return [value * factor for value in self._values]
+        return np.frombuffer(self._values, dtype=np.int64) * factor
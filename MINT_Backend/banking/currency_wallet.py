@@ -7,6 +7,8 @@ class CurrencyWallet:
     Manages exchange rates (relative to a base currency) and the institution's
     liquidity pool for each currency.
     """
+    RATE_BASE = "USD"  # currency every rate is quoted against
+
     def __init__(self):
         # Exchange rates relative to USD (base)
         self.rates = {
@@ -22,23 +24,56 @@ class CurrencyWallet:
             "GBP": 10000,
             "JPY": 1000000
         }
+        self._rebuild_cross()
+
+    def _rebuild_cross(self) -> None:
+        """Precompute every pair rate; must run whenever self.rates changes."""
+        # _cross[from][to] multiplies an amount in `from` into `to`
+        self._cross = {
+            f: {t: self.rates[t] / self.rates[f] for t in self.rates}
+            for f in self.rates
+        }
+        # Flat base column/row so to_base/from_base cost a single dict lookup
+        self._to_base = {f: row[self.RATE_BASE] for f, row in self._cross.items()}
+        self._from_base = self._cross[self.RATE_BASE]
+
+    def _rate(self, from_cur: str, to_cur: str) -> float:
+        """Return the multiplier converting from_cur into to_cur."""
+        try:
+            return self._cross[from_cur][to_cur]
+        except KeyError as e:
+            raise ValueError(f"Unsupported currency: {e.args[0]}") from None
+
+    def set_rate(self, currency: str, rate: float) -> None:
+        """Update a currency's rate against the base and rebuild cross rates."""
+        if rate <= 0:
+            raise ValueError("Exchange rate must be positive.")
+        self.rates[currency] = rate
+        self._rebuild_cross()
 
     def to_base(self, amount: float, currency: str) -> float:
         """Convert an amount in given currency to base currency (USD)."""
-        if currency not in self.rates:
-            raise ValueError(f"Unsupported currency: {currency}")
-        return amount / self.rates[currency]
+        if currency == self.RATE_BASE:
+            return amount
+        try:
+            return amount * self._to_base[currency]
+        except KeyError:
+            raise ValueError(f"Unsupported currency: {currency}") from None
 
     def from_base(self, amount: float, currency: str) -> float:
         """Convert an amount from base currency to given currency."""
-        if currency not in self.rates:
-            raise ValueError(f"Unsupported currency: {currency}")
-        return amount * self.rates[currency]
+        if currency == self.RATE_BASE:
+            return amount
+        try:
+            return amount * self._from_base[currency]
+        except KeyError:
+            raise ValueError(f"Unsupported currency: {currency}") from None
 
     def convert(self, amount: float, from_cur: str, to_cur: str) -> float:
-        """Convert amount from one currency to another via base currency."""
-        base_amount = self.to_base(amount, from_cur)
-        return self.from_base(base_amount, to_cur)
+        """Convert amount from one currency to another using the precomputed cross rate."""
+        if from_cur == to_cur and from_cur in self.rates:
+            return amount
+        return amount * self._rate(from_cur, to_cur)
 
     def check_liquidity(self, currency: str, amount: float) -> bool:
         """Return True if the bank has at least `amount` of `currency`."""
@@ -1,70 +1,270 @@
 """
 FinancialEngine – core banking operations, inherits from FindAccount.
 """
+import bisect
 import json
+import math
 import os
+import time
+from collections import defaultdict, namedtuple
+from concurrent import futures
 from datetime import datetime
+from itertools import accumulate
+from .balance_book import BalanceBook
 from .find_account import FindAccount
 
+try:
+    import orjson
+except ImportError:  # optional C-accelerated encoder; fall back to stdlib json
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # optional; bulk conversions fall back to a Python loop
+    np = None
+
+try:
+    import ijson
+except ImportError:  # optional streaming decoder; fall back to a whole-file load
+    ijson = None
+
+
+def _dumps(obj, pretty: bool = False) -> bytes:
+    """Encode obj as compact (or indented, if pretty) UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# One history record; a tuple with named fields instead of a dict per row
+Txn = namedtuple("Txn", ["timestamp", "action", "amount", "currency", "details"])
+
+# Errors that mean a snapshot could not be decoded
+_DECODE_ERRORS = (ValueError, ijson.JSONError) if ijson is not None else (ValueError,)
+
+
+def _iter_entries(data: dict):
+    """
+    Yield (section, key, value) for each entry of a decoded snapshot's
+    top-level objects and (name, None, value) for its top-level scalars.
+    """
+    for section, value in data.items():
+        if isinstance(value, dict):
+            for key, item in value.items():
+                yield section, key, item
+        else:
+            yield section, None, value
+
+
+def _stream_entries(f):
+    """
+    Same as _iter_entries, but parses the snapshot file incrementally with
+    ijson so only one entry (e.g. one user's history) is built at a time.
+    """
+    section = key = entry = builder = None
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == entry and event in ("end_map", "end_array"):
+                yield section, key, builder.value
+                builder = None
+        elif prefix == "":
+            if event == "map_key":
+                section = value
+        elif prefix == section:
+            if event == "map_key":
+                key, entry = value, f"{section}.{value}"
+            elif event not in ("start_map", "end_map"):
+                yield section, None, value
+        elif prefix == entry:
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            else:
+                yield section, key, value
+
+
 class FinancialEngine(FindAccount):
     """
     Handles all user transactions: deposit, withdraw, exchange, transfer,
-    credit, debit, and balance inquiry. Balances are stored in a base currency.
+    credit, debit, and balance inquiry. Balances are stored in a base currency
+    as integer micro-units, so repeated operations never accumulate float drift.
     """
     OVERDRAFT_LIMIT = 100  # allowed negative balance (e.g., -100 in base currency)
+    BALANCE_SCALE = 1_000_000  # stored balance units per unit of base currency
+    MAX_AMOUNT_UNITS = 10 ** 18  # largest single amount; int64 tops out near 9.2e18
+    MIN_BALANCE_UNITS, MAX_BALANCE_UNITS = -2 ** 63, 2 ** 63 - 1  # BalanceBook's int64 range
+    FLUSH_INTERVAL = 50  # journaled operations between full snapshots
 
     def __init__(self, base_currency: str = "USD"):
         super().__init__()
         self.base_currency = base_currency
-        self.balances = {}  # phone -> amount in base currency
-        self.transactions = {}  # phone -> list of transactions
-
-    def _get_base_balance(self, phone: str) -> float:
-        """Internal helper to get current balance (base currency)."""
-        return self.balances.get(phone, 0.0)
-
-    def _log_transaction(self, phone: str, action: str, amount: float, currency: str, details: str = "") -> None:
-        """Helper to append a transaction record for a user."""
-        if phone not in self.transactions:
-            self.transactions[phone] = []
-        
-        record = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "action": action,
-            "amount": amount,
-            "currency": currency,
-            "details": details
-        }
+        self.balances = BalanceBook()  # phone -> micro-units of base currency
+        self.transactions = defaultdict(list)  # phone -> list of transactions
+        self._ts_index = defaultdict(list)  # phone -> timestamps parallel to transactions[phone]
+        self.data_file = None  # snapshot path, bound by load_data
+        self._journal_file = None  # append-only journal, opened lazily
+        self._dirty = False  # state changed since the last snapshot
+        self._pending_ops = 0  # journal entries since the last snapshot
+        self._seq = 0  # sequence number of the last journal entry
+        self._saver = None  # single-worker executor for background saves
+        self._pending_save = None  # Future of the latest background save
+        self.pretty_json = False  # indent snapshots for human-readable debugging
+
+    def _base_units(self, amount: float, currency: str) -> int:
+        """Convert an entered amount to integer micro-units of the base currency."""
+        units = self.to_base(amount, currency) * self.BALANCE_SCALE
+        if not math.isfinite(units) or abs(units) > self.MAX_AMOUNT_UNITS:
+            raise ValueError(f"Amount out of range: {amount}")
+        return round(units)
+
+    def _checked_balance(self, units: int) -> int:
+        """Return a prospective balance, or raise ValueError if it would not fit in int64."""
+        if not self.MIN_BALANCE_UNITS <= units <= self.MAX_BALANCE_UNITS:
+            raise ValueError("Resulting balance out of range.")
+        return units
+
+    def _record(self, phone: int, action: str, amount: float, currency: str, details: str = "") -> dict:
+        """Append a transaction record for a user and return its journal part."""
+        # Timestamp is epoch seconds; formatted only for display. The wall
+        # clock can step backwards, so never stamp before the user's last record
+        stamps = self._ts_index[phone]
+        now = int(time.time())
+        if stamps and now < stamps[-1]:
+            now = stamps[-1]
+        record = Txn(now, action, amount, currency, details)
+        self.transactions[phone].append(record)
+        stamps.append(now)
+        return {"phone": phone, "balance_units": self.balances[phone], "record": record._asdict()}
+
+    def _journal_txn(self, *parts: dict) -> None:
+        """Journal one operation's records as a single entry, so it replays all or nothing."""
+        self._append_journal({"op": "txn", "liquidity": self.liquidity, "parts": list(parts)})
+
+    def _log_transaction(self, phone: int, action: str, amount: float, currency: str, details: str = "") -> None:
+        """Helper to append and journal a transaction record for a user."""
+        self._journal_txn(self._record(phone, action, amount, currency, details))
+
+    @staticmethod
+    def _journal_path(filename: str) -> str:
+        """Return the journal path that belongs to a snapshot file."""
+        return os.path.splitext(filename)[0] + ".log"
+
+    def _append_journal(self, entry: dict) -> None:
+        """
+        Mark state dirty and append one compact JSON line to the journal.
+        Journaling only starts once load_data has bound a snapshot file.
+        """
+        self._dirty = True
+        if self.data_file is None:
+            return
+        self._seq += 1
+        entry["seq"] = self._seq
+        if self._journal_file is None:
+            self._journal_file = open(self._journal_path(self.data_file), 'ab')
+        self._journal_file.write(_dumps(entry) + b"\n")
+        self._journal_file.flush()
+        self._pending_ops += 1
+        if self._pending_ops >= self.FLUSH_INTERVAL:
+            self.flush(wait=False)
+
+    def _truncate_journal(self) -> None:
+        """Close and remove the journal once a snapshot covers its entries."""
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+        path = self._journal_path(self.data_file)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _replay_journal(self) -> None:
+        """
+        Re-apply journal entries written after the last snapshot. Entries a
+        background save already captured are recognised by sequence number.
+        A torn final line from an interrupted write is cut off, so new entries
+        start on a fresh line instead of being glued onto the partial one.
+        """
+        path = self._journal_path(self.data_file)
+        if not os.path.exists(path):
+            return
+        with open(path, 'r+b') as f:
+            good = 0  # offset just past the last complete entry
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = _loads(line)
+                except json.JSONDecodeError:
+                    break
+                good += len(line)
+                if entry["seq"] <= self._seq:
+                    continue
+                self._seq = entry["seq"]
+                if entry["op"] == "register":
+                    self.contacts[entry["phone"]] = entry["name"]
+                else:
+                    self.liquidity = entry["liquidity"]
+                    # Older journals hold a single record at the top level
+                    for part in entry.get("parts", (entry,)):
+                        self._replay_part(part)
+                self._dirty = True
+                self._pending_ops += 1
+            f.truncate(good)
+
+    def _replay_part(self, part: dict) -> None:
+        """Restore one user's balance and transaction record from a journal entry."""
+        phone = part["phone"]
+        if "balance_units" in part:
+            self.balances[phone] = part["balance_units"]
+        else:  # journals from before integer micro-units
+            self.balances[phone] = round(part["balance"] * self.BALANCE_SCALE)
+        record = Txn(**part["record"])
         self.transactions[phone].append(record)
+        stamps = self._ts_index[phone]
+        stamps.append(max(record.timestamp, stamps[-1]) if stamps else record.timestamp)
+
+    def register(self, phone: str, name: str) -> None:
+        """Register a new user and journal the registration."""
+        super().register(phone, name)
+        self._append_journal({"op": "register", "phone": self._phone_key(phone), "name": name})
 
     def deposit(self, phone: str, amount: float, currency: str) -> None:
         """User deposits cash; bank receives currency and increases user's balance."""
+        phone = self._phone_key(phone)
         # Convert to base and update user balance
-        base_amount = self.to_base(amount, currency)
-        self.balances[phone] = self._get_base_balance(phone) + base_amount
+        base_units = self._base_units(amount, currency)
+        self.balances[phone] = self._checked_balance(self.balances[phone] + base_units)
         # Bank receives the currency
         self.adjust_liquidity(currency, amount)
         self._log_transaction(phone, "Deposit", amount, currency)
 
     def withdraw(self, phone: str, amount: float, currency: str) -> None:
         """User withdraws cash; bank gives currency and decreases user's balance."""
-        base_amount = self.to_base(amount, currency)
+        phone = self._phone_key(phone)
+        base_units = self._base_units(amount, currency)
         # Check user's balance (including overdraft)
-        if self._get_base_balance(phone) - base_amount < -self.OVERDRAFT_LIMIT:
+        remaining = self._checked_balance(self.balances[phone] - base_units)
+        if remaining < -self.OVERDRAFT_LIMIT * self.BALANCE_SCALE:
             raise ValueError("Insufficient funds (overdraft limit exceeded).")
         # Check bank's liquidity
         if not self.check_liquidity(currency, amount):
             raise ValueError("Bank does not have enough liquidity for this withdrawal.")
         # Update user balance and bank liquidity
-        self.balances[phone] = self._get_base_balance(phone) - base_amount
+        self.balances[phone] = remaining
         self.adjust_liquidity(currency, -amount)
         self._log_transaction(phone, "Withdrawal", amount, currency)
 
     def exchange(self, phone: str, from_cur: str, to_cur: str, amount: float) -> None:
         """User exchanges an amount from one currency to another."""
-        base_amount = self.to_base(amount, from_cur)
+        phone = self._phone_key(phone)
+        base_units = self._base_units(amount, from_cur)
         # Check user balance (overdraft allowed)
-        if self._get_base_balance(phone) - base_amount < -self.OVERDRAFT_LIMIT:
+        remaining = self._checked_balance(self.balances[phone] - base_units)
+        if remaining < -self.OVERDRAFT_LIMIT * self.BALANCE_SCALE:
             raise ValueError("Insufficient funds for exchange.")
         # Calculate how much of the target currency the user will get
         target_amount = self.convert(amount, from_cur, to_cur)
@@ -72,7 +272,7 @@ class FinancialEngine(FindAccount):
         if not self.check_liquidity(to_cur, target_amount):
             raise ValueError("Bank does not have enough target currency.")
         # Update user balance (deduct base amount of source currency)
-        self.balances[phone] = self._get_base_balance(phone) - base_amount
+        self.balances[phone] = remaining
         # Liquidity changes: bank receives source currency, gives target currency
         self.adjust_liquidity(from_cur, amount)
         self.adjust_liquidity(to_cur, -target_amount)
@@ -84,36 +284,48 @@ class FinancialEngine(FindAccount):
         currency. Only user balances (in base currency) are updated; liquidity is
         unaffected because money stays inside the system.
         """
-        base_amount = self.to_base(amount, currency)
+        src, dst = self._phone_key(sender), self._phone_key(receiver)
+        base_units = self._base_units(amount, currency)
+        bal = self.balances
         # Check sender's balance
-        if self._get_base_balance(sender) - base_amount < -self.OVERDRAFT_LIMIT:
+        remaining = self._checked_balance(bal[src] - base_units)
+        if remaining < -self.OVERDRAFT_LIMIT * self.BALANCE_SCALE:
             raise ValueError("Insufficient funds for transfer.")
-        # Update balances
-        self.balances[sender] = self._get_base_balance(sender) - base_amount
-        self.balances[receiver] = self._get_base_balance(receiver) + base_amount
-        self._log_transaction(sender, "Transfer Out", amount, currency, f"To {receiver}")
-        self._log_transaction(receiver, "Transfer In", amount, currency, f"From {sender}")
+        # Check the receiver's new balance before writing either side;
+        # a self-transfer nets to zero
+        received = self._checked_balance((remaining if dst == src else bal[dst]) + base_units)
+        bal[src] = remaining
+        bal[dst] = received
+        # Both sides go into one journal entry so a crash cannot split them
+        self._journal_txn(
+            self._record(src, "Transfer Out", amount, currency, f"To {receiver}"),
+            self._record(dst, "Transfer In", amount, currency, f"From {sender}"),
+        )
 
     def credit(self, phone: str, amount: float, currency: str) -> None:
         """Admin operation: bank gives money to user (decreases liquidity)."""
-        base_amount = self.to_base(amount, currency)
+        phone = self._phone_key(phone)
+        base_units = self._base_units(amount, currency)
+        credited = self._checked_balance(self.balances[phone] + base_units)
         # Check liquidity
         if not self.check_liquidity(currency, amount):
             raise ValueError("Bank does not have enough currency to credit.")
         # Increase user balance
-        self.balances[phone] = self._get_base_balance(phone) + base_amount
+        self.balances[phone] = credited
         # Decrease liquidity (bank gives away currency)
         self.adjust_liquidity(currency, -amount)
         self._log_transaction(phone, "Credit (Admin)", amount, currency)
 
     def debit(self, phone: str, amount: float, currency: str) -> None:
         """Admin operation: bank takes money from user (increases liquidity)."""
-        base_amount = self.to_base(amount, currency)
+        phone = self._phone_key(phone)
+        base_units = self._base_units(amount, currency)
         # Check user's balance with overdraft
-        if self._get_base_balance(phone) - base_amount < -self.OVERDRAFT_LIMIT:
+        remaining = self._checked_balance(self.balances[phone] - base_units)
+        if remaining < -self.OVERDRAFT_LIMIT * self.BALANCE_SCALE:
             raise ValueError("User would exceed overdraft limit.")
         # Decrease user balance
-        self.balances[phone] = self._get_base_balance(phone) - base_amount
+        self.balances[phone] = remaining
         # Increase liquidity (bank receives currency)
         self.adjust_liquidity(currency, amount)
         self._log_transaction(phone, "Debit (Admin)", amount, currency)
@@ -123,42 +335,196 @@ class FinancialEngine(FindAccount):
         Return the user's balance. If currency is None or matches base_currency,
         return the base amount; otherwise convert to the requested currency.
         """
-        base_bal = self._get_base_balance(phone)
+        base_bal = self.balances[self._phone_key(phone)] / self.BALANCE_SCALE
         if currency is None or currency == self.base_currency:
             return base_bal
         return self.from_base(base_bal, currency)
 
-    def get_transaction_history(self, phone: str) -> list:
-        """Return the list of transactions for a given phone number."""
-        self.find_account(phone)  # Ensure user exists
-        return self.transactions.get(phone, [])
+    def show_all_balances(self, currency: str | None = None):
+        """
+        Return every user's balance in `currency` (base if None), ordered like
+        iteration over self.balances. With NumPy installed this is a float64
+        ndarray produced by one vectorized multiply; otherwise a list.
+        """
+        rate = self._rate(self.RATE_BASE, currency or self.RATE_BASE)
+        return self.balances.scaled(rate / self.BALANCE_SCALE)
+
+    def bulk_convert_to(self, currency: str) -> dict:
+        """Return a {phone: balance} mapping with every balance in `currency`."""
+        converted = self.show_all_balances(currency)
+        if np is not None:
+            converted = converted.tolist()
+        return dict(zip(self.balances, converted))
+
+    def get_transaction_history(self, phone: str, start_ts: int | None = None,
+                                end_ts: int | None = None) -> list:
+        """
+        Return the transactions for a given phone number, optionally limited to
+        timestamps in [start_ts, end_ts]. Records are appended in time order, so
+        the range is located by bisecting the per-user timestamp index. New
+        records are never stamped earlier than the user's previous one.
+        """
+        key = self._phone_key(phone)
+        txns = self.transactions.get(key)
+        if txns is None:
+            # No history: tell an unknown user apart from one with no activity
+            if key not in self.contacts:
+                raise ValueError(f"User {phone} not found.")
+            return []
+        if start_ts is None and end_ts is None:
+            return txns
+        stamps = self._ts_index[key]
+        lo = 0 if start_ts is None else bisect.bisect_left(stamps, start_ts)
+        hi = len(stamps) if end_ts is None else bisect.bisect_right(stamps, end_ts)
+        return txns[lo:hi]
+
+    def flush(self, wait: bool = True) -> None:
+        """
+        Write a snapshot to the bound data file if anything has changed. With
+        wait=True, also block until any background save has finished.
+        """
+        if self._dirty and self.data_file is not None:
+            self.save_data(self.data_file, wait=wait)
+        elif wait and self._pending_save is not None:
+            pending, self._pending_save = self._pending_save, None
+            futures.wait([pending])
+            if self.data_file is not None and not pending.cancelled() and pending.exception() is None:
+                self._truncate_journal()
+
+    @staticmethod
+    def _write_snapshot(filename: str, payload: bytes) -> None:
+        """Write payload to a temp file and atomically swap it into place."""
+        tmp = filename + ".tmp"
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp, filename)
 
-    def save_data(self, filename: str = "data.json") -> None:
-        """Serialize balances, contacts, and liquidity to a JSON file."""
+    @staticmethod
+    def _report_save_error(future: futures.Future) -> None:
+        """Done-callback that surfaces a failed background save."""
+        if not future.cancelled() and future.exception() is not None:
+            print(f"Warning: Could not save persistence data: {future.exception()}")
+
+    def save_data(self, filename: str = "data.json", wait: bool = True) -> None:
+        """
+        Serialize balances, contacts, and liquidity to a JSON snapshot, written
+        atomically via a temp file. With wait=False the write runs on a
+        background thread and supersedes any save still queued. A synchronous
+        save to the bound data file also discards its now-redundant journal.
+        """
+        # JSON object keys must be strings; phone keys are ints in memory
         data = {
-            "balances": self.balances,
-            "contacts": self.contacts,
+            "balance_units": {str(k): v for k, v in self.balances.items()},
+            "contacts": {str(k): v for k, v in self.contacts.items()},
             "liquidity": self.liquidity,
             "base_currency": self.base_currency,
-            "transactions": self.transactions
+            "transactions": {
+                str(k): [t._asdict() for t in v] for k, v in self.transactions.items()
+            },
+            "journal_seq": self._seq
         }
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=4)
+        payload = _dumps(data, pretty=self.pretty_json)
+        pending, self._pending_save = self._pending_save, None
+        if pending is not None and not pending.cancel():
+            if wait:
+                futures.wait([pending])  # never race a running write
+        if wait:
+            self._write_snapshot(filename, payload)
+            if filename == self.data_file:
+                self._truncate_journal()
+        else:
+            if self._saver is None:
+                self._saver = futures.ThreadPoolExecutor(max_workers=1)
+            self._pending_save = self._saver.submit(self._write_snapshot, filename, payload)
+            self._pending_save.add_done_callback(self._report_save_error)
+        if filename == self.data_file:
+            self._dirty = False
+            self._pending_ops = 0
 
-    def load_data(self, filename: str = "data.json") -> None:
-        """Restore state from a JSON file if it exists."""
-        if not os.path.exists(filename):
-            return
+    def _restore(self, entries) -> None:
+        """
+        Rebuild in-memory state from snapshot entries. Nothing is replaced
+        until every entry has been read, so a corrupt file changes nothing.
+        """
+        balances, transactions = BalanceBook(), defaultdict(list)
+        contacts, liquidity = {}, {}
+        base_currency, seq = self.base_currency, 0
+        owners = {}  # (section, phone key) -> snapshot key it came from
+
+        def phone_key(section, key):
+            # Older snapshots keyed users by the phone string as typed, so
+            # "0712345678" and "712345678" could be two users; never merge them
+            phone = self._phone_key(key)
+            first = owners.setdefault((section, phone), key)
+            if first != key:
+                raise ValueError(f"Phones {first!r} and {key!r} map to the same account")
+            return phone
+
+        for section, key, value in entries:
+            # Map back to internal storage; phone keys are ints in memory
+            if section == "balance_units":
+                balances[phone_key(section, key)] = value
+            elif section == "balances":  # snapshots from before integer micro-units
+                balances[phone_key(section, key)] = round(value * self.BALANCE_SCALE)
+            elif section == "contacts":
+                contacts[phone_key(section, key)] = value
+            elif section == "liquidity":
+                liquidity[key] = value
+            elif section == "transactions":
+                # Snapshots written before epoch timestamps stored formatted strings
+                for t in value:
+                    if isinstance(t["timestamp"], str):
+                        t["timestamp"] = int(datetime.strptime(t["timestamp"], "%Y-%m-%d %H:%M:%S").timestamp())
+                transactions[phone_key(section, key)] = [Txn(**t) for t in value]
+            elif section == "base_currency":
+                base_currency = value
+            elif section == "journal_seq":
+                seq = value
+        self.balances, self.contacts, self.transactions = balances, contacts, transactions
+        self.liquidity = liquidity or self.liquidity
+        self.base_currency, self._seq = base_currency, seq
+        # Running max keeps the index sorted for bisect even where stored
+        # timestamps step backwards (e.g. legacy local times across a DST change)
+        self._ts_index = defaultdict(list, {
+            phone: list(accumulate((t.timestamp for t in records), max))
+            for phone, records in transactions.items()
+        })
+
+    @staticmethod
+    def _set_aside(path: str) -> str:
+        """Rename an unreadable file to an unused `<path>.corrupt[N]` name and return it."""
+        target, n = path + ".corrupt", 1
+        while os.path.exists(target):
+            n += 1
+            target = f"{path}.corrupt{n}"
+        os.replace(path, target)
+        return target
 
-        try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
-            
-            # Map back to internal storage
-            self.balances = data.get("balances", {})
-            self.contacts = data.get("contacts", {})
-            self.liquidity = data.get("liquidity", self.liquidity)
-            self.base_currency = data.get("base_currency", self.base_currency)
-            self.transactions = data.get("transactions", {})
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Warning: Could not load persistence data: {e}")
\ No newline at end of file
+    def load_data(self, filename: str = "data.json") -> None:
+        """
+        Restore state from a JSON snapshot if it exists, then replay the
+        journal tail. Binds `filename` as the target for flush(). A snapshot
+        that cannot be loaded is moved aside, with its journal, so later
+        saves never overwrite it.
+        """
+        if os.path.exists(filename):
+            try:
+                with open(filename, 'rb') as f:
+                    if ijson is not None:
+                        self._restore(_stream_entries(f))
+                    else:
+                        self._restore(_iter_entries(_loads(f.read())))
+            except (IOError, *_DECODE_ERRORS) as e:
+                print(f"Warning: Could not load persistence data: {e}")
+                try:
+                    # The journal only makes sense on top of its snapshot
+                    for path in (filename, self._journal_path(filename)):
+                        if os.path.exists(path):
+                            print(f"Moved {path} to {self._set_aside(path)}")
+                except OSError as e:
+                    print(f"Warning: Persistence disabled for this session: {e}")
+                    return  # leave data_file unbound so nothing is overwritten
+                self.data_file = filename
+                return
+        self.data_file = filename
+        self._replay_journal()
@@ -7,10 +7,12 @@ class FindAccount(Account):
     """
     Adds a method to safely retrieve a phone number if the user exists.
     """
-    def find_account(self, phone: str) -> str:
+    def find_account(self, phone: str) -> int:
         """
-        Return the phone number if the user exists; otherwise raise ValueError.
+        Return the normalized phone key if the user exists; otherwise raise
+        ValueError.
         """
-        if not self.exists(phone):
+        key = self._phone_key(phone)
+        if key not in self.contacts:
             raise ValueError(f"User {phone} not found.")
-        return phone
\ No newline at end of file
+        return key
\ No newline at end of file
@@ -1,8 +1,13 @@
 """
 Console interface for the banking system.
 """
+import sys
+from datetime import datetime
 from banking.financial_engine import FinancialEngine
 
+SUPPORTED = frozenset({"USD", "EUR", "GBP", "JPY"})  # currencies offered at the prompt
+HISTORY_ROW = "{:<20} | {:<15} | {:<10.2f} | {:<4} | {}".format  # one history line
+
 def print_menu():
     print("\n===== BANKING SYSTEM =====")
     print("1. Register user")
@@ -20,11 +25,12 @@ def print_menu():
 def main():
     # Choose base currency once (fix the bug)
     base = input("Enter base currency (USD/EUR/GBP/JPY) [USD]: ").upper() or "USD"
-    if base not in ["USD", "EUR", "GBP", "JPY"]:
+    if base not in SUPPORTED:
         print("Invalid base currency. Using USD.")
         base = "USD"
     bank = FinancialEngine(base_currency=base)
-    bank.load_data()  # Load existing session if any
+    bank.pretty_json = "--pretty" in sys.argv[1:]  # indented data.json for debugging
+    bank.load_data()  # Load existing session if any; operations are journaled
 
     while True:
         print_menu()
@@ -35,7 +41,6 @@ def main():
                 phone = input("Phone number: ").strip()
                 name = input("Full name: ").strip()
                 bank.register(phone, name)
-                bank.save_data()
                 print(f"User {name} registered successfully.")
 
             elif choice == "2":
@@ -43,7 +48,6 @@ def main():
                 amount = float(input("Amount: "))
                 currency = input("Currency (USD/EUR/GBP/JPY): ").upper()
                 bank.deposit(phone, amount, currency)
-                bank.save_data()
                 print("Deposit successful.")
 
             elif choice == "3":
@@ -51,7 +55,6 @@ def main():
                 amount = float(input("Amount: "))
                 currency = input("Currency (USD/EUR/GBP/JPY): ").upper()
                 bank.withdraw(phone, amount, currency)
-                bank.save_data()
                 print("Withdrawal successful.")
 
             elif choice == "4":
@@ -60,7 +63,6 @@ def main():
                 to_cur = input("To currency: ").upper()
                 amount = float(input("Amount to exchange: "))
                 bank.exchange(phone, from_cur, to_cur, amount)
-                bank.save_data()
                 print("Exchange successful.")
 
             elif choice == "5":
@@ -69,7 +71,6 @@ def main():
                 amount = float(input("Amount: "))
                 currency = input("Currency (USD/EUR/GBP/JPY): ").upper()
                 bank.transfer(sender, receiver, amount, currency)
-                bank.save_data()
                 print("Transfer successful.")
 
             elif choice == "6":
@@ -77,7 +78,6 @@ def main():
                 amount = float(input("Amount to credit: "))
                 currency = input("Currency: ").upper()
                 bank.credit(phone, amount, currency)
-                bank.save_data()
                 print("Credit successful.")
 
             elif choice == "7":
@@ -85,7 +85,6 @@ def main():
                 amount = float(input("Amount to debit: "))
                 currency = input("Currency: ").upper()
                 bank.debit(phone, amount, currency)
-                bank.save_data()
                 print("Debit successful.")
 
             elif choice == "8":
@@ -106,11 +105,16 @@ def main():
                     print(f"\n--- Transaction History for {phone} ---")
                     print(f"{'Timestamp':<20} | {'Action':<15} | {'Amount':<10} | {'Cur':<4} | {'Details'}")
                     print("-" * 80)
-                    for t in history:
-                        print(f"{t['timestamp']:<20} | {t['action']:<15} | {t['amount']:<10.2f} | {t['currency']:<4} | {t['details']}")
+                    # Format every row first and emit them in a single write
+                    lines = [
+                        HISTORY_ROW(datetime.fromtimestamp(t.timestamp).strftime("%Y-%m-%d %H:%M:%S"),
+                                    t.action, t.amount, t.currency, t.details)
+                        for t in history
+                    ]
+                    sys.stdout.write("\n".join(lines) + "\n")
 
             elif choice == "10":
-                bank.save_data()
+                bank.flush()
                 print("Goodbye!")
                 break
 
@@ -0,0 +1,46 @@
+import unittest
+from banking.account import Account
+
+
+class TestAccount(unittest.TestCase):
+    def setUp(self):
+        self.acc = Account()
+        self.acc.register("0712345678", "Alice")
+
+    def test_register_and_lookup(self):
+        self.assertTrue(self.acc.exists("0712345678"))
+        self.assertEqual(self.acc.get_name("0712345678"), "Alice")
+
+    def test_phone_keys_are_integers(self):
+        # Leading zeros and surrounding whitespace do not create a new user
+        self.assertIn(712345678, self.acc.contacts)
+        self.assertTrue(self.acc.exists(" 712345678 "))
+        with self.assertRaises(ValueError):
+            self.acc.register("712345678", "Duplicate")
+
+    def test_e164_plus_prefix_accepted(self):
+        self.acc.register("+254712345678", "Carol")
+        self.assertIn(254712345678, self.acc.contacts)
+        self.assertTrue(self.acc.exists("254712345678"))
+        self.assertEqual(self.acc.get_name("+254712345678"), "Carol")
+
+    def test_separators_ignored(self):
+        self.assertTrue(self.acc.exists("071-234 5678"))
+        self.assertTrue(self.acc.exists("(071) 234.5678"))
+
+    def test_invalid_phone_rejected(self):
+        with self.assertRaises(ValueError):
+            self.acc.register("07-12ab", "Bob")
+        with self.assertRaises(ValueError):
+            self.acc.register("1" * 16, "Bob")
+
+    def test_unknown_user(self):
+        self.assertFalse(self.acc.exists("0700000000"))
+        self.assertFalse(self.acc.exists("not a phone"))
+        self.assertFalse(self.acc.exists("++254712345678"))
+        with self.assertRaises(ValueError):
+            self.acc.get_name("0700000000")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from banking.balance_book import BalanceBook
+
+
+class TestBalanceBook(unittest.TestCase):
+    def setUp(self):
+        self.book = BalanceBook({1: 10, 2: 20, 3: 30})
+
+    def test_missing_phone_reads_zero_without_insert(self):
+        self.assertEqual(self.book[99], 0)
+        self.assertNotIn(99, self.book)
+        self.assertEqual(len(self.book), 3)
+
+    def test_in_place_update(self):
+        self.book[1] += 5
+        self.book[4] -= 3
+        self.assertEqual(self.book[1], 15)
+        self.assertEqual(self.book[4], -3)
+        self.assertEqual(list(self.book), [1, 2, 3, 4])
+
+    def test_delete_moves_last_entry(self):
+        del self.book[1]
+        self.assertEqual(dict(self.book.items()), {3: 30, 2: 20})
+        with self.assertRaises(KeyError):
+            del self.book[1]
+
+    def test_overflow_leaves_book_unchanged(self):
+        with self.assertRaises(OverflowError):
+            self.book[4] = 2 ** 63
+        self.assertNotIn(4, self.book)
+        self.assertEqual(dict(self.book.items()), {1: 10, 2: 20, 3: 30})
+        self.book[4] = 40
+        self.assertEqual(self.book[4], 40)
+
+    def test_scaled(self):
+        self.assertEqual(list(self.book.scaled(2)), [20, 40, 60])
+
+
+if __name__ == "__main__":
+    unittest.main()
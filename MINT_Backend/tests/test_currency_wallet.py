@@ -18,6 +18,22 @@ class TestCurrencyWallet(unittest.TestCase):
         # 100 EUR to GBP: 100 / 0.85 * 0.73 ≈ 85.882
         self.assertAlmostEqual(self.cw.convert(100, "EUR", "GBP"), 100 / 0.85 * 0.73, places=2)
 
+    def test_convert_same_currency(self):
+        self.assertEqual(self.cw.convert(42, "JPY", "JPY"), 42)
+        with self.assertRaises(ValueError):
+            self.cw.convert(42, "XYZ", "XYZ")
+
+    def test_set_rate_rebuilds_cross_rates(self):
+        self.assertAlmostEqual(self.cw.convert(100, "USD", "EUR"), 85)
+        self.cw.set_rate("EUR", 0.9)
+        self.assertAlmostEqual(self.cw.convert(100, "USD", "EUR"), 90)
+        self.assertAlmostEqual(self.cw.from_base(100, "EUR"), 90)
+        self.assertAlmostEqual(self.cw.to_base(90, "EUR"), 100)
+
+    def test_set_rate_rejects_non_positive(self):
+        with self.assertRaises(ValueError):
+            self.cw.set_rate("EUR", 0)
+
     def test_liquidity_present(self):
         self.assertTrue(self.cw.check_liquidity("USD", 5000))
 
@@ -0,0 +1,52 @@
+import unittest
+from banking.financial_engine import FinancialEngine
+
+
+class TestFinancialEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = FinancialEngine(base_currency="USD")
+        self.engine.register("1111111111", "Alice")
+        self.engine.register("2222222222", "Bob")
+        self.engine.deposit("1111111111", 100, "USD")
+        self.engine.deposit("2222222222", 85, "EUR")
+
+    def test_bulk_convert_to(self):
+        converted = self.engine.bulk_convert_to("EUR")
+        self.assertAlmostEqual(converted[1111111111], 85)
+        self.assertAlmostEqual(converted[2222222222], 85)
+
+    def test_show_all_balances(self):
+        self.assertEqual([round(b, 6) for b in self.engine.show_all_balances()], [100, 100])
+        self.assertEqual([round(b, 6) for b in self.engine.show_all_balances("GBP")], [73, 73])
+
+    def test_balances_do_not_drift(self):
+        for _ in range(10):
+            self.engine.deposit("1111111111", 0.1, "USD")
+        self.assertEqual(self.engine.show_balance("1111111111"), 101)
+
+    def test_out_of_range_amount_rejected(self):
+        for amount in (1e14, float("inf"), float("nan")):
+            with self.assertRaises(ValueError):
+                self.engine.deposit("1111111111", amount, "USD")
+        self.engine.deposit("1111111111", 1, "USD")
+        self.assertEqual(self.engine.show_balance("1111111111"), 101)
+
+    def test_transfer_at_balance_limit_changes_nothing(self):
+        for _ in range(9):
+            self.engine.deposit("2222222222", 1e12, "USD")
+        self.engine.deposit("1111111111", 1e12, "USD")
+        before = self.engine.bulk_convert_to("USD")
+        with self.assertRaises(ValueError):
+            self.engine.transfer("1111111111", "2222222222", 5e11, "USD")
+        with self.assertRaises(ValueError):
+            self.engine.deposit("2222222222", 1e12, "USD")
+        self.assertEqual(self.engine.bulk_convert_to("USD"), before)
+        self.assertEqual(len(self.engine.get_transaction_history("1111111111")), 2)
+
+    def test_bulk_convert_to_unsupported_currency(self):
+        with self.assertRaises(ValueError):
+            self.engine.bulk_convert_to("XYZ")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 import os
+from unittest import mock
 from banking.financial_engine import FinancialEngine
 
 class TestHistory(unittest.TestCase):
@@ -26,11 +27,12 @@ class TestHistory(unittest.TestCase):
         
         # 3. Verify
         self.assertEqual(len(history), 3)
-        self.assertEqual(history[0]["action"], "Deposit")
-        self.assertEqual(history[1]["action"], "Withdrawal")
-        self.assertEqual(history[2]["action"], "Exchange")
-        self.assertEqual(history[2]["currency"], "USD")
-        self.assertIn("To EUR", history[2]["details"])
+        self.assertEqual(history[0].action, "Deposit")
+        self.assertEqual(history[1].action, "Withdrawal")
+        self.assertEqual(history[2].action, "Exchange")
+        self.assertEqual(history[2].currency, "USD")
+        self.assertIn("To EUR", history[2].details)
+        self.assertIsInstance(history[0].timestamp, int)
 
     def test_transfer_history(self):
         receiver = "0987654321"
@@ -42,13 +44,35 @@ class TestHistory(unittest.TestCase):
         
         # Verify Sender
         sender_hist = self.engine.get_transaction_history(self.phone)
-        self.assertEqual(sender_hist[-1]["action"], "Transfer Out")
-        self.assertIn(receiver, sender_hist[-1]["details"])
+        self.assertEqual(sender_hist[-1].action, "Transfer Out")
+        self.assertIn(receiver, sender_hist[-1].details)
         
         # Verify Receiver
         recv_hist = self.engine.get_transaction_history(receiver)
-        self.assertEqual(recv_hist[-1]["action"], "Transfer In")
-        self.assertIn(self.phone, recv_hist[-1]["details"])
+        self.assertEqual(recv_hist[-1].action, "Transfer In")
+        self.assertIn(self.phone, recv_hist[-1].details)
+
+    def test_history_time_range(self):
+        with mock.patch("banking.financial_engine.time.time", side_effect=[100, 200, 300]):
+            self.engine.deposit(self.phone, 10, "USD")
+            self.engine.deposit(self.phone, 20, "USD")
+            self.engine.deposit(self.phone, 30, "USD")
+
+        in_range = self.engine.get_transaction_history(self.phone, start_ts=150, end_ts=300)
+        self.assertEqual([t.amount for t in in_range], [20, 30])
+        self.assertEqual(len(self.engine.get_transaction_history(self.phone, end_ts=100)), 1)
+        self.assertEqual(self.engine.get_transaction_history(self.phone, start_ts=301), [])
+
+    def test_clock_step_back_keeps_order(self):
+        with mock.patch("banking.financial_engine.time.time", side_effect=[300, 200, 400]):
+            self.engine.deposit(self.phone, 10, "USD")
+            self.engine.deposit(self.phone, 20, "USD")
+            self.engine.deposit(self.phone, 30, "USD")
+
+        history = self.engine.get_transaction_history(self.phone)
+        self.assertEqual([t.timestamp for t in history], [300, 300, 400])
+        in_range = self.engine.get_transaction_history(self.phone, start_ts=250, end_ts=350)
+        self.assertEqual([t.amount for t in in_range], [10, 20])
 
     def test_history_persistence(self):
         self.engine.deposit(self.phone, 100, "USD")
@@ -60,7 +84,7 @@ class TestHistory(unittest.TestCase):
         
         history = new_engine.get_transaction_history(self.phone)
         self.assertEqual(len(history), 1)
-        self.assertEqual(history[0]["action"], "Deposit")
+        self.assertEqual(history[0].action, "Deposit")
 
 if __name__ == "__main__":
     unittest.main()
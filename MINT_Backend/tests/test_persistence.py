@@ -6,13 +6,17 @@ from banking.financial_engine import FinancialEngine
 class TestPersistence(unittest.TestCase):
     def setUp(self):
         self.filename = "test_data.json"
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
+        self.journal = "test_data.log"
+        for path in (self.filename, self.journal):
+            if os.path.exists(path):
+                os.remove(path)
         self.engine = FinancialEngine(base_currency="USD")
 
     def tearDown(self):
-        if os.path.exists(self.filename):
-            os.remove(self.filename)
+        for path in (self.filename, self.journal,
+                     self.filename + ".corrupt", self.journal + ".corrupt"):
+            if os.path.exists(path):
+                os.remove(path)
 
     def test_save_and_load(self):
         # 1. Setup sample data
@@ -36,5 +40,153 @@ class TestPersistence(unittest.TestCase):
         self.assertEqual(new_engine.base_currency, "USD")
         self.assertEqual(new_engine.liquidity["EUR"], 10500) # Initial 10000 + 500
 
+    def test_corrupt_snapshot_leaves_state_untouched(self):
+        self.engine.register("1234567890", "Test User")
+        with open(self.filename, 'w') as f:
+            f.write('{"balances": {"1234567890": 5.0}, "contacts": {')  # truncated
+        self.engine.load_data(self.filename)
+        self.assertEqual(self.engine.get_name("1234567890"), "Test User")
+        self.assertEqual(self.engine.show_balance("1234567890"), 0)
+
+    def test_failed_load_never_clobbers_snapshot(self):
+        original = '{"balances": {"1234567890": 5.0}, "contacts": {'  # truncated
+        with open(self.filename, 'w') as f:
+            f.write(original)
+        with open(self.journal, 'w') as f:
+            f.write('{"seq": 1}\n')
+        self.engine.load_data(self.filename)
+        self.engine.register("1234567890", "Test User")
+        self.engine.flush()
+
+        with open(self.filename + ".corrupt") as f:
+            self.assertEqual(f.read(), original)
+        self.assertTrue(os.path.exists(self.journal + ".corrupt"))
+        new_engine = FinancialEngine()
+        new_engine.load_data(self.filename)
+        self.assertEqual(new_engine.get_name("1234567890"), "Test User")
+
+    def _write_baseline_snapshot(self, phones):
+        # Format written before integer keys: phones as typed, float balances
+        data = {
+            "balances": {p: 50.0 for p in phones},
+            "contacts": {p: f"User {p}" for p in phones},
+            "liquidity": {"USD": 10100, "EUR": 10000, "GBP": 10000, "JPY": 1000000},
+            "base_currency": "USD",
+            "transactions": {p: [{"timestamp": "2024-01-01 10:00:00", "action": "Deposit",
+                                  "amount": 50.0, "currency": "USD", "details": ""}]
+                             for p in phones},
+        }
+        with open(self.filename, "w") as f:
+            json.dump(data, f, indent=4)
+
+    def test_load_baseline_snapshot(self):
+        self._write_baseline_snapshot(["071-234-5678", "+254 722 000000"])
+        self.engine.load_data(self.filename)
+        self.assertEqual(self.engine.get_name("0712345678"), "User 071-234-5678")
+        self.assertEqual(self.engine.show_balance("071-234-5678"), 50)
+        self.assertEqual(self.engine.show_balance("254722000000"), 50)
+        history = self.engine.get_transaction_history("+254 722 000000")
+        self.assertEqual(history[0].action, "Deposit")
+        self.assertIsInstance(history[0].timestamp, int)
+
+    def test_baseline_phones_that_collide_are_not_merged(self):
+        self._write_baseline_snapshot(["0712345678", "712345678"])
+        self.engine.load_data(self.filename)
+        self.assertFalse(self.engine.exists("712345678"))
+        self.assertEqual(self.engine.show_balance("712345678"), 0)
+
+    def test_journal_replay_without_snapshot(self):
+        phone = "1234567890"
+        self.engine.load_data(self.filename)  # binds the file, nothing on disk yet
+        self.engine.register(phone, "Test User")
+        self.engine.deposit(phone, 250, "USD")
+        self.assertFalse(os.path.exists(self.filename))
+        self.assertTrue(os.path.exists(self.journal))
+
+        # A new engine recovers the journaled operations
+        new_engine = FinancialEngine()
+        new_engine.load_data(self.filename)
+        self.assertEqual(new_engine.get_name(phone), "Test User")
+        self.assertEqual(new_engine.show_balance(phone), 250)
+        self.assertEqual(new_engine.liquidity["USD"], 10250)
+        self.assertEqual(len(new_engine.get_transaction_history(phone)), 1)
+
+    def test_flush_writes_snapshot_and_clears_journal(self):
+        phone = "1234567890"
+        self.engine.load_data(self.filename)
+        self.engine.register(phone, "Test User")
+        self.engine.deposit(phone, 100, "USD")
+        self.engine.flush()
+        self.assertTrue(os.path.exists(self.filename))
+        self.assertFalse(os.path.exists(self.journal))
+
+        new_engine = FinancialEngine()
+        new_engine.load_data(self.filename)
+        self.assertEqual(new_engine.show_balance(phone), 100)
+
+    def test_background_save_then_journal_tail(self):
+        phone = "1234567890"
+        self.engine.load_data(self.filename)
+        self.engine.register(phone, "Test User")
+        self.engine.deposit(phone, 100, "USD")
+        self.engine.flush(wait=False)
+        self.engine.deposit(phone, 50, "USD")  # only in the journal
+        self.engine._pending_save.result()
+        self.assertFalse(os.path.exists(self.filename + ".tmp"))
+
+        # Entries covered by the snapshot are not applied twice
+        new_engine = FinancialEngine()
+        new_engine.load_data(self.filename)
+        self.assertEqual(new_engine.show_balance(phone), 150)
+        self.assertEqual(len(new_engine.get_transaction_history(phone)), 2)
+
+    def test_torn_journal_tail_is_truncated(self):
+        phone = "1234567890"
+        self.engine.load_data(self.filename)
+        self.engine.register(phone, "Test User")
+        self.engine.deposit(phone, 100, "USD")
+        self.engine._journal_file.close()
+        with open(self.journal, "ab") as f:
+            f.write(b'{"op": "txn", "se')  # interrupted write
+
+        # Operations after recovery land on their own lines and survive
+        recovered = FinancialEngine()
+        recovered.load_data(self.filename)
+        recovered.deposit(phone, 50, "USD")
+        recovered.deposit(phone, 25, "USD")
+        recovered._journal_file.close()
+
+        new_engine = FinancialEngine()
+        new_engine.load_data(self.filename)
+        self.assertEqual(new_engine.show_balance(phone), 175)
+        self.assertEqual(len(new_engine.get_transaction_history(phone)), 3)
+
+    def test_transfer_is_one_journal_entry(self):
+        self.engine.load_data(self.filename)
+        self.engine.register("1111111111", "Alice")
+        self.engine.register("2222222222", "Bob")
+        self.engine.deposit("1111111111", 100, "USD")
+        self.engine.transfer("1111111111", "2222222222", 40, "USD")
+        self.engine._journal_file.close()
+        with open(self.journal, "rb") as f:
+            lines = f.readlines()
+        self.assertEqual(len(lines), 4)
+
+        # Losing the transfer line loses both sides, never just the credit
+        with open(self.journal, "wb") as f:
+            f.writelines(lines[:3] + [lines[3][:-10]])
+        new_engine = FinancialEngine()
+        new_engine.load_data(self.filename)
+        self.assertEqual(new_engine.show_balance("1111111111"), 100)
+        self.assertEqual(new_engine.show_balance("2222222222"), 0)
+
+        with open(self.journal, "wb") as f:
+            f.writelines(lines)
+        new_engine = FinancialEngine()
+        new_engine.load_data(self.filename)
+        self.assertEqual(new_engine.show_balance("1111111111"), 60)
+        self.assertEqual(new_engine.show_balance("2222222222"), 40)
+        self.assertEqual(len(new_engine.get_transaction_history("2222222222")), 1)
+
 if __name__ == "__main__":
     unittest.main()